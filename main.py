@@ -1,42 +1,103 @@
 # LMS Content Push MVP
 # A FastAPI-based service for selectively pushing learner content using xAPI standards
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Set, Union
+from datetime import datetime, timedelta, timezone
 import uuid
 import json
 import httpx
+import orjson
 import asyncio
 import os
 import re
+import time
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
-from sqlalchemy import create_engine, Column, String, DateTime, JSON, Boolean, Text
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    JSON,
+    Boolean,
+    Text,
+    Index,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
 import hashlib
+import hmac
+from types import MappingProxyType
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes read back from the database (SQLite) as UTC"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./lms_push.db")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its asyncio driver (aiosqlite/asyncpg)."""
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        async_url = make_url(url).set(drivername="postgresql+asyncpg")
+        # asyncpg rejects libpq's sslmode but takes the same modes as `ssl`
+        sslmode = async_url.query.get("sslmode")
+        if sslmode is not None:
+            async_url = async_url.difference_update_query(["sslmode"])
+            async_url = async_url.update_query_dict({"ssl": sslmode})
+        return async_url.render_as_string(hide_password=False)
+    return url
+
+
+_engine_kwargs: Dict[str, Any] = {"pool_pre_ping": True}
+if not DATABASE_URL.startswith("sqlite"):
+    # Size the pool to match request concurrency; tune per worker alongside
+    # any external pooler (e.g. PgBouncer).
+    _engine_kwargs.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", 20)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        pool_timeout=30,
+        pool_recycle=3600,
+    )
+
+engine = create_async_engine(_async_database_url(DATABASE_URL), **_engine_kwargs)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
 
 # Database Models
 class ContentPushRecord(Base):
     __tablename__ = "content_push_records"
+    __table_args__ = (Index("ix_push_learner_content", "learner_id", "content_id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     learner_id = Column(String, nullable=False)
@@ -44,10 +105,12 @@ class ContentPushRecord(Base):
     content_type = Column(String, nullable=False)
     xapi_statement = Column(JSON, nullable=False)
     destination = Column(String, nullable=False)
-    status = Column(String, default="pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    pushed_at = Column(DateTime, nullable=True)
+    status = Column(String, default="pending", index=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow)
+    pushed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
+    # Identifies the same content pushed to the same destination
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)
 
 
 class FilterRule(Base):
@@ -59,11 +122,8 @@ class FilterRule(Base):
     grade_threshold = Column(String, nullable=True)  # Minimum grade
     tags_required = Column(JSON, nullable=True)  # Required tags
     learner_groups = Column(JSON, nullable=True)  # Specific learner groups
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-
-
-Base.metadata.create_all(bind=engine)
+    is_active = Column(Boolean, default=True, index=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow)
 
 
 # Pydantic Models
@@ -126,23 +186,49 @@ class DrivePushRequest(BaseModel):
     force_push: bool = False
 
 
+_GDRIVE_ID_RE = re.compile(r"/d/([\w-]+)")
+_ONEDRIVE_MARK = "download=1"
+
+
+def _google_drive_download_url(url: str) -> str:
+    match = _GDRIVE_ID_RE.search(url)
+    if match:
+        file_id = match.group(1)
+        return f"https://drive.google.com/uc?export=download&id={file_id}"
+    return url
+
+
+def _one_drive_download_url(url: str) -> str:
+    if _ONEDRIVE_MARK in url:
+        return url
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{_ONEDRIVE_MARK}"
+
+
+_DRIVE_LINK_CONVERTERS = {
+    DrivePlatform.GOOGLE_DRIVE: _google_drive_download_url,
+    DrivePlatform.ONE_DRIVE: _one_drive_download_url,
+}
+
+
 def convert_drive_link(url: str, platform: DrivePlatform) -> str:
     """Convert shared drive link to direct download link."""
-    if platform == DrivePlatform.GOOGLE_DRIVE:
-        match = re.search(r"/d/([\w-]+)", url)
-        if match:
-            file_id = match.group(1)
-            return f"https://drive.google.com/uc?export=download&id={file_id}"
-    elif platform == DrivePlatform.ONE_DRIVE:
-        if "download=1" not in url:
-            separator = "&" if "?" in url else "?"
-            return url + separator + "download=1"
-    return url
+    converter = _DRIVE_LINK_CONVERTERS.get(platform)
+    return converter(url) if converter else url
+
+
+def content_push_hash(content: LearnerContent, destination: str) -> str:
+    """SHA-256 of the learner content and destination, used to drop repeat pushes"""
+    digest = hashlib.sha256(
+        f"{content.learner_id}|{content.content_id}|{destination}|".encode()
+    )
+    digest.update(orjson.dumps(content.model_dump(), option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
 
 
 class XAPIStatement(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     actor: Dict[str, Any]
     verb: Dict[str, Any]
     object: Dict[str, Any]
@@ -150,6 +236,23 @@ class XAPIStatement(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
+# Constant xAPI fragments shared by every statement (treat as read-only)
+_VERB_COMPLETED = {
+    "id": "http://adlnet.gov/expapi/verbs/completed",
+    "display": {"en-US": "completed"},
+}
+_VERB_SUBMITTED = {
+    "id": "http://adlnet.gov/expapi/verbs/answered",
+    "display": {"en-US": "submitted"},
+}
+_VERB_MAP = MappingProxyType(
+    {"completed": _VERB_COMPLETED, "submitted": _VERB_SUBMITTED}
+)
+_OBJ_PREFIX = "http://lms.example.com/content/"
+_ACTIVITY_TYPE_PREFIX = "http://adlnet.gov/expapi/activities/"
+_CONTEXT_INSTRUCTOR = {"name": "LMS System", "objectType": "Agent"}
+
+
 # xAPI Statement Builder
 class XAPIBuilder:
     @staticmethod
@@ -164,25 +267,14 @@ class XAPIBuilder:
             "objectType": "Agent",
         }
 
-        verb_map = {
-            "completed": {
-                "id": "http://adlnet.gov/expapi/verbs/completed",
-                "display": {"en-US": "completed"},
-            },
-            "submitted": {
-                "id": "http://adlnet.gov/expapi/verbs/answered",
-                "display": {"en-US": "submitted"},
-            },
-        }
-
-        verb = verb_map.get(action, verb_map["completed"])
+        verb = _VERB_MAP.get(action, _VERB_COMPLETED)
 
         obj = {
-            "id": f"http://lms.example.com/content/{content.content_id}",
+            "id": _OBJ_PREFIX + content.content_id,
             "definition": {
                 "name": {"en-US": content.title},
                 "description": {"en-US": content.description or ""},
-                "type": f"http://adlnet.gov/expapi/activities/{content.content_type.value}",
+                "type": _ACTIVITY_TYPE_PREFIX + content.content_type.value,
             },
             "objectType": "Activity",
         }
@@ -196,7 +288,7 @@ class XAPIBuilder:
             }
 
         context = {
-            "instructor": {"name": "LMS System", "objectType": "Agent"},
+            "instructor": _CONTEXT_INSTRUCTOR,
             "platform": "LMS Platform",
             "language": "en-US",
             "extensions": {
@@ -211,26 +303,74 @@ class XAPIBuilder:
         )
 
 
+# Active filter rules are cached across requests; rules change far less
+# often than content is pushed. create_filter_rule invalidates the cache.
+RULES_CACHE_TTL = 30.0
+
+
+@dataclass
+class ActiveRules:
+    rules: List[FilterRule]
+    by_type: Dict[str, List[FilterRule]]
+
+    @classmethod
+    def build(cls, rules: List[FilterRule]) -> "ActiveRules":
+        # Rules with no content_types apply to every type; each bucket keeps
+        # the original rule order so the first matching rule is unchanged
+        by_type = {
+            ct.value: [
+                rule
+                for rule in rules
+                if not rule.content_types or ct.value in rule.content_types
+            ]
+            for ct in ContentType
+        }
+        return cls(rules=rules, by_type=by_type)
+
+    def for_type(self, content_type: str) -> List[FilterRule]:
+        return self.by_type.get(content_type, [])
+
+
+_RULES_CACHE: Dict[str, Any] = {"active": None, "expires": 0.0}
+
+
+async def get_active_rules(db: AsyncSession) -> ActiveRules:
+    """Return active filter rules, reloading them once the cache TTL lapses"""
+    cached = _RULES_CACHE["active"]
+    if cached is not None and time.monotonic() < _RULES_CACHE["expires"]:
+        return cached
+
+    result = await db.execute(select(FilterRule).where(FilterRule.is_active == True))
+    active = ActiveRules.build(result.scalars().all())
+    _RULES_CACHE.update(active=active, expires=time.monotonic() + RULES_CACHE_TTL)
+    return active
+
+
+def invalidate_rules_cache():
+    _RULES_CACHE["expires"] = 0.0
+
+
 # Content Filter Engine
 class ContentFilter:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def should_push(
+    async def should_push(
         self, content: LearnerContent, rule_id: Optional[str] = None
     ) -> tuple[bool, str]:
         """Determine if content should be pushed based on filter rules"""
 
         if rule_id:
-            rule = self.db.query(FilterRule).filter(FilterRule.id == rule_id).first()
+            rule = await self.db.get(FilterRule, rule_id)
             if not rule:
                 return False, "Filter rule not found"
             rules = [rule]
         else:
-            rules = self.db.query(FilterRule).filter(FilterRule.is_active == True).all()
-
-        if not rules:
-            return True, "No active filter rules - allowing all content"
+            active = await get_active_rules(self.db)
+            if not active.rules:
+                return True, "No active filter rules - allowing all content"
+            # Only rules that accept this content type can match
+            rules = active.for_type(content.content_type.value)
 
         for rule in rules:
             if self._matches_rule(content, rule):
@@ -255,7 +395,7 @@ class ContentFilter:
 
         # Check required tags
         if rule.tags_required:
-            if not all(tag in content.tags for tag in rule.tags_required):
+            if not set(content.tags).issuperset(rule.tags_required):
                 return False
 
         # Check learner groups (would need additional learner metadata in real implementation)
@@ -266,13 +406,27 @@ class ContentFilter:
         return True
 
 
+def _error_body(response: httpx.Response, limit: int = 512) -> str:
+    """Decode at most `limit` bytes of an error response for the push record"""
+    return response.content[:limit].decode(errors="replace")
+
+
 # Destination Adapters
 class BaseDestinationAdapter:
-    def __init__(self, config: DestinationConfig):
+    def __init__(self, config: DestinationConfig, client: httpx.AsyncClient):
         self.config = config
+        self.client = client
+        # Headers are fixed per destination, so build them once
+        self.headers = self.build_headers()
+
+    def build_headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if self.config.auth_token:
+            headers["Authorization"] = f"Bearer {self.config.auth_token}"
+        return headers
 
     async def push_content(
-        self, statement: XAPIStatement, content: LearnerContent
+        self, statement: Dict[str, Any], content: LearnerContent
     ) -> Dict[str, Any]:
         raise NotImplementedError
 
@@ -280,68 +434,52 @@ class BaseDestinationAdapter:
 class LRSAdapter(BaseDestinationAdapter):
     """Learning Record Store adapter for xAPI statements"""
 
+    def build_headers(self) -> Dict[str, str]:
+        headers = super().build_headers()
+        headers["X-Experience-API-Version"] = "1.0.3"
+        return headers
+
     async def push_content(
-        self, statement: XAPIStatement, content: LearnerContent
+        self, statement: Dict[str, Any], content: LearnerContent
     ) -> Dict[str, Any]:
-        headers = {
-            "Content-Type": "application/json",
-            "X-Experience-API-Version": "1.0.3",
-        }
-
-        if self.config.auth_token:
-            headers["Authorization"] = f"Bearer {self.config.auth_token}"
+        response = await self.client.post(
+            f"{self.config.endpoint}/statements",
+            content=orjson.dumps(statement),
+            headers=self.headers,
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config.endpoint}/statements",
-                json=statement.dict(),
-                headers=headers,
-                timeout=30.0,
+        if response.status_code not in [200, 201, 204]:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"LRS push failed: {_error_body(response)}",
             )
 
-            if response.status_code not in [200, 201, 204]:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"LRS push failed: {response.text}",
-                )
-
-            return {
-                "status": "success",
-                "lrs_response": response.json() if response.text else {},
-            }
+        return {"status": "success", "status_code": response.status_code}
 
 
 class WebhookAdapter(BaseDestinationAdapter):
     """Generic webhook adapter"""
 
     async def push_content(
-        self, statement: XAPIStatement, content: LearnerContent
+        self, statement: Dict[str, Any], content: LearnerContent
     ) -> Dict[str, Any]:
         payload = {
-            "xapi_statement": statement.dict(),
-            "content_metadata": content.dict(),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "xapi_statement": statement,
+            "content_metadata": content.model_dump(),
+            "timestamp": _utcnow(),
         }
 
-        headers = {"Content-Type": "application/json"}
-        if self.config.auth_token:
-            headers["Authorization"] = f"Bearer {self.config.auth_token}"
+        response = await self.client.post(
+            self.config.endpoint, content=orjson.dumps(payload), headers=self.headers
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.config.endpoint, json=payload, headers=headers, timeout=30.0
+        if response.status_code not in [200, 201, 202]:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Webhook push failed: {_error_body(response)}",
             )
 
-            if response.status_code not in [200, 201, 202]:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Webhook push failed: {response.text}",
-                )
-
-            return {
-                "status": "success",
-                "webhook_response": response.json() if response.text else {},
-            }
+        return {"status": "success", "status_code": response.status_code}
 
 
 # Destination Factory
@@ -349,11 +487,13 @@ class DestinationFactory:
     adapters = {"lrs": LRSAdapter, "webhook": WebhookAdapter}
 
     @classmethod
-    def create_adapter(cls, config: DestinationConfig) -> BaseDestinationAdapter:
+    def create_adapter(
+        cls, config: DestinationConfig, client: httpx.AsyncClient
+    ) -> BaseDestinationAdapter:
         adapter_class = cls.adapters.get(config.type)
         if not adapter_class:
             raise ValueError(f"Unknown destination type: {config.type}")
-        return adapter_class(config)
+        return adapter_class(config, client)
 
 
 # FastAPI App
@@ -361,47 +501,88 @@ app = FastAPI(
     title="LMS Content Push Service",
     description="Selective content pushing with xAPI standards",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Path to static assets
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 
 security = HTTPBearer()
 
 # Configuration (in production, use proper config management)
-DESTINATIONS = {
-    "main_lrs": DestinationConfig(
-        name="Main LRS",
-        type="lrs",
-        endpoint=os.getenv("LRS_ENDPOINT", "https://lrs.example.com/xapi"),
-        auth_token=os.getenv("LRS_TOKEN"),
-    ),
-    "analytics_webhook": DestinationConfig(
-        name="Analytics Webhook",
-        type="webhook",
-        endpoint=os.getenv("WEBHOOK_ENDPOINT", "https://analytics.example.com/webhook"),
-        auth_token=os.getenv("WEBHOOK_TOKEN"),
-    ),
-}
+API_TOKEN = os.getenv("API_TOKEN")
+
+DESTINATIONS = MappingProxyType(
+    {
+        "main_lrs": DestinationConfig(
+            name="Main LRS",
+            type="lrs",
+            endpoint=os.getenv("LRS_ENDPOINT", "https://lrs.example.com/xapi"),
+            auth_token=os.getenv("LRS_TOKEN"),
+        ),
+        "analytics_webhook": DestinationConfig(
+            name="Analytics Webhook",
+            type="webhook",
+            endpoint=os.getenv(
+                "WEBHOOK_ENDPOINT", "https://analytics.example.com/webhook"
+            ),
+            auth_token=os.getenv("WEBHOOK_TOKEN"),
+        ),
+    }
+)
+_VALID_DESTINATION_NAMES = frozenset(DESTINATIONS)
+
+
+# Shared outbound HTTP client so pushes reuse pooled keep-alive connections
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+HTTP_TIMEOUT = 30.0
+HTTP_MAX_CONNECTIONS = 200
+# One adapter per configured destination, built on startup
+ADAPTERS: Dict[str, BaseDestinationAdapter] = {}
+
+
+@app.on_event("startup")
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@app.on_event("startup")
+async def open_http_client():
+    global HTTP_CLIENT
+    HTTP_CLIENT = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=100, max_connections=HTTP_MAX_CONNECTIONS
+        ),
+        timeout=HTTP_TIMEOUT,
+        http2=True,
+    )
+    ADAPTERS.update(
+        (name, DestinationFactory.create_adapter(config, HTTP_CLIENT))
+        for name, config in DESTINATIONS.items()
+    )
+
+
+async def close_http_client():
+    ADAPTERS.clear()
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
 
 
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Simple auth check (replace with proper auth in production)
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    expected_token = os.getenv("API_TOKEN")
-    if not expected_token:
+    if not API_TOKEN:
         raise RuntimeError("API_TOKEN environment variable not set")
-    if credentials.credentials != expected_token:
+    if not hmac.compare_digest(credentials.credentials.encode(), API_TOKEN.encode()):
         raise HTTPException(status_code=401, detail="Invalid authentication token")
     return credentials.credentials
 
@@ -415,69 +596,193 @@ async def root():
 @app.get("/test", response_class=HTMLResponse)
 async def get_test_interface():
     """Serve the HTML test interface"""
-    return FileResponse(STATIC_DIR / "test.html")
+    return FileResponse(
+        STATIC_DIR / "test.html", headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc)}
+    return {"status": "healthy", "timestamp": _utcnow()}
 
 
 @app.post("/push-content")
 async def push_content(
     request: PushRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     token: str = Depends(verify_token),
 ):
     """Push learner content to specified destination"""
 
     # Check if destination exists
-    if request.destination not in DESTINATIONS:
+    if request.destination not in _VALID_DESTINATION_NAMES:
         raise HTTPException(
             status_code=400, detail=f"Unknown destination: {request.destination}"
         )
 
     # Check filter rules
     content_filter = ContentFilter(db)
-    should_push, reason = content_filter.should_push(request.content)
+    should_push, reason = await content_filter.should_push(request.content)
 
     if not should_push and not request.force_push:
         raise HTTPException(status_code=403, detail=f"Content filtered: {reason}")
 
     # Create xAPI statement
     statement = XAPIBuilder.create_statement(request.content)
+    # Serialize once; the same JSON-ready dict is stored and pushed
+    statement_dict = statement.model_dump(mode="json")
+
+    content_hash = content_push_hash(request.content, request.destination)
+    pending = _pending_push_for(content_hash)
+    if pending:
+        return _duplicate_push_response(
+            pending["id"], pending["xapi_statement"], "pending", reason
+        )
 
-    # Create push record
-    push_record = ContentPushRecord(
-        learner_id=request.content.learner_id,
-        content_id=request.content.content_id,
-        content_type=request.content.content_type.value,
-        xapi_statement=statement.dict(),
-        destination=request.destination,
-        status="pending",
+    result = await db.execute(
+        select(ContentPushRecord).where(ContentPushRecord.content_hash == content_hash)
     )
-    db.add(push_record)
-    db.commit()
+    push_record = result.scalar_one_or_none()
+    record_row = None
+
+    if push_record is not None:
+        # Same content already pushed to this destination
+        if not _push_is_retryable(push_record):
+            return _duplicate_push_response(
+                push_record.id,
+                push_record.xapi_statement,
+                push_record.status,
+                reason,
+            )
 
-    # Schedule background push
-    background_tasks.add_task(
-        execute_push, push_record.id, statement, request.content, request.destination
-    )
+        # Retry a failed or abandoned push on its existing record. The UPDATE
+        # only matches the row as read, so of two concurrent claims one wins;
+        # created_at restarts the stale clock for the new attempt.
+        push_id = push_record.id
+        QUEUED_PUSH_IDS.add(push_id)
+        try:
+            claim = await db.execute(
+                update(ContentPushRecord)
+                .where(
+                    ContentPushRecord.id == push_id,
+                    ContentPushRecord.status == push_record.status,
+                    ContentPushRecord.created_at == push_record.created_at,
+                )
+                .values(
+                    xapi_statement=statement_dict,
+                    status="pending",
+                    error_message=None,
+                    created_at=_utcnow(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except BaseException:
+            QUEUED_PUSH_IDS.discard(push_id)
+            raise
+        if claim.rowcount != 1:
+            QUEUED_PUSH_IDS.discard(push_id)
+            return _duplicate_push_response(
+                push_id, push_record.xapi_statement, "pending", reason
+            )
+    else:
+        # Re-check after the await above; another request may have queued it
+        pending = _pending_push_for(content_hash)
+        if pending:
+            return _duplicate_push_response(
+                pending["id"], pending["xapi_statement"], "pending", reason
+            )
+
+        # The worker inserts the record; respond without waiting on a commit
+        push_id = str(uuid.uuid4())
+        record_row = {
+            "id": push_id,
+            "learner_id": request.content.learner_id,
+            "content_id": request.content.content_id,
+            "content_type": request.content.content_type.value,
+            "xapi_statement": statement_dict,
+            "destination": request.destination,
+            "status": "pending",
+            "created_at": _utcnow(),
+            "content_hash": content_hash,
+        }
+
+    # Hand off to the push workers without blocking the request on a full queue
+    try:
+        PUSH_QUEUE.put_nowait(
+            PushJob(
+                push_id=push_id,
+                statement=statement_dict,
+                content=request.content,
+                destination=request.destination,
+                record=record_row,
+            )
+        )
+    except asyncio.QueueFull:
+        if push_record is not None:
+            # Leave the record retryable instead of stuck in pending
+            QUEUED_PUSH_IDS.discard(push_id)
+            await db.execute(
+                update(ContentPushRecord)
+                .where(ContentPushRecord.id == push_id)
+                .values(status="failed", error_message=push_record.error_message)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        raise HTTPException(
+            status_code=503,
+            detail="Push queue is full, retry later",
+            headers={"Retry-After": "1"},
+        )
+
+    # Register only once queued; nothing awaits between the put and here
+    QUEUED_PUSH_IDS.add(push_id)
+    if record_row is not None:
+        PENDING_PUSHES[push_id] = record_row
+        _PENDING_HASHES[content_hash] = push_id
 
     return {
         "message": "Content push initiated",
-        "push_id": push_record.id,
+        "push_id": push_id,
         "statement_id": statement.id,
         "filter_reason": reason,
     }
 
 
+def _pending_push_for(content_hash: str) -> Optional[Dict[str, Any]]:
+    push_id = _PENDING_HASHES.get(content_hash)
+    return PENDING_PUSHES.get(push_id) if push_id else None
+
+
+def _push_is_retryable(record: ContentPushRecord) -> bool:
+    """Whether a stored push may be queued again: it failed, or was abandoned"""
+    if record.id in QUEUED_PUSH_IDS:
+        return False
+    if record.status == "failed":
+        return True
+    # Lost to a restart or a failed status write once past PUSH_STALE_AFTER
+    return record.status == "pending" and (
+        record.created_at is None
+        or _as_utc(record.created_at) < _utcnow() - PUSH_STALE_AFTER
+    )
+
+
+def _duplicate_push_response(
+    push_id: str, statement: Dict[str, Any], status: str, reason: str
+) -> Dict[str, Any]:
+    return {
+        "message": "Duplicate content push",
+        "push_id": push_id,
+        "statement_id": statement.get("id"),
+        "status": status,
+        "filter_reason": reason,
+    }
+
+
 @app.post("/push-from-drive")
 async def push_from_drive(
     request: DrivePushRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     token: str = Depends(verify_token),
 ):
     """Push content referenced by a Google Drive or OneDrive link."""
@@ -494,68 +799,341 @@ async def push_from_drive(
 
     return await push_content(
         push_req,
-        background_tasks,
         db,
         token,
     )
 
 
 async def execute_push(
-    push_id: str, statement: XAPIStatement, content: LearnerContent, destination: str
-):
-    """Execute the actual push in background"""
-    db = SessionLocal()
+    statement: Dict[str, Any], content: LearnerContent, destination: str
+) -> Dict[str, Any]:
+    """Deliver a statement and return the status fields for its push record"""
     try:
-        push_record = (
-            db.query(ContentPushRecord).filter(ContentPushRecord.id == push_id).first()
-        )
+        # Execute push
+        await ADAPTERS[destination].push_content(statement, content)
+
+    except Exception as e:
+        error = e.detail if isinstance(e, HTTPException) else str(e)
+        logger.error(f"Failed to push content {content.content_id}: {error}")
+        return {"status": "failed", "pushed_at": None, "error_message": error}
 
-        # Get destination config and create adapter
-        dest_config = DESTINATIONS[destination]
-        adapter = DestinationFactory.create_adapter(dest_config)
+    logger.info(f"Successfully pushed content {content.content_id} to {destination}")
+    return {"status": "success", "pushed_at": _utcnow(), "error_message": None}
 
-        # Execute push
-        result = await adapter.push_content(statement, content)
 
-        # Update record
-        push_record.status = "success"
-        push_record.pushed_at = datetime.utcnow()
+@dataclass
+class PushJob:
+    push_id: str
+    statement: Dict[str, Any]
+    content: LearnerContent
+    destination: str
+    # Row to insert for a new push; None when the record already exists
+    record: Optional[Dict[str, Any]] = None
+
+
+# Bounded queue drained by a fixed pool of workers, so burst load cannot
+# fan out into unbounded concurrent sessions and sockets. The queue and
+# PUSH_SLOTS are created on startup, in the loop that serves the app.
+PUSH_QUEUE: Optional[asyncio.Queue] = None
+PUSH_QUEUE_SIZE = 10_000
+PUSH_WORKERS = int(os.getenv("PUSH_WORKERS", 8))
+PUSH_BATCH_SIZE = 32
+PUSH_BATCH_WINDOW = 0.01  # seconds to wait for a batch to fill
+PUSH_SHUTDOWN_GRACE = HTTP_TIMEOUT  # seconds queued pushes get on shutdown
+_push_worker_tasks: List[asyncio.Task] = []
+# Final push statuses awaiting one bulk UPDATE, and the task that writes them
+PUSH_STATUS_QUEUE: Optional[asyncio.Queue] = None
+_push_status_task: Optional[asyncio.Task] = None
+# Pushes in flight across all workers, capped at the HTTP client's pool size
+PUSH_SLOTS: Optional[asyncio.Semaphore] = None
+
+# Queued pushes whose record the worker has not inserted yet, by push_id
+# and by content hash, so status lookups and deduplication can see them
+PENDING_PUSHES: Dict[str, Dict[str, Any]] = {}
+_PENDING_HASHES: Dict[str, str] = {}
+# push_ids queued or being delivered by this process
+QUEUED_PUSH_IDS: Set[str] = set()
+# A pending record older than this that this process is not working on was
+# abandoned, and may be claimed again by a new push of the same content
+PUSH_STALE_AFTER = timedelta(seconds=HTTP_TIMEOUT + 300)
+# Accepted pushes whose record could not be stored, reported as failed
+UNRECORDED_PUSHES: Dict[str, Dict[str, Any]] = {}
+# Accepted push_ids that lost a content-hash race to another process's record
+PUSH_ALIASES: Dict[str, str] = {}
+# Oldest entries are evicted from both maps past this size
+PUSH_MEMORY_LIMIT = 10_000
+PUSH_INSERT_ATTEMPTS = 3
+PUSH_INSERT_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+
+# Status WebSocket waiters per push_id, woken once the final status is committed
+PUSH_EVENTS: Dict[str, Set[asyncio.Event]] = {}
+PUSH_STATUS_TIMEOUT = 300.0
+
+
+def _remember(mapping: Dict[str, Any], key: str, value: Any):
+    """Store an entry, evicting the oldest ones past PUSH_MEMORY_LIMIT"""
+    mapping.pop(key, None)
+    mapping[key] = value
+    while len(mapping) > PUSH_MEMORY_LIMIT:
+        del mapping[next(iter(mapping))]
+
+
+def notify_push_finished(push_id: str):
+    for event in PUSH_EVENTS.pop(push_id, ()):
+        event.set()
+
+
+async def _next_batch(queue: asyncio.Queue) -> List[Any]:
+    """Wait for one queued item, then gather more until the batch or window fills"""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PUSH_BATCH_WINDOW
+    while len(batch) < PUSH_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _insert_push_records(rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Bulk insert new push records, mapping each push_id to its stored record id"""
+    async with SessionLocal() as db:
+        try:
+            await db.execute(insert(ContentPushRecord), rows)
+            await db.commit()
+            return {row["id"]: row["id"] for row in rows}
+        except IntegrityError:
+            await db.rollback()
+
+        # A duplicate raced in from another process; store the rest one by one
+        # and point each duplicate at the record that won
+        stored = {}
+        for row in rows:
+            try:
+                await db.execute(insert(ContentPushRecord), [row])
+                await db.commit()
+                stored[row["id"]] = row["id"]
+            except IntegrityError:
+                await db.rollback()
+                existing_id = await db.scalar(
+                    select(ContentPushRecord.id).where(
+                        ContentPushRecord.content_hash == row["content_hash"]
+                    )
+                )
+                if existing_id is None:
+                    raise
+                stored[row["id"]] = existing_id
+        return stored
+
+
+async def _store_push_records(rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Insert push records, retrying transient database errors with backoff"""
+    for attempt in range(1, PUSH_INSERT_ATTEMPTS + 1):
+        try:
+            return await _insert_push_records(rows)
+        except Exception:
+            if attempt == PUSH_INSERT_ATTEMPTS:
+                raise
+            logger.warning(
+                "Storing %d push records failed (attempt %d), retrying",
+                len(rows),
+                attempt,
+                exc_info=True,
+            )
+            await asyncio.sleep(PUSH_INSERT_BACKOFF * 2 ** (attempt - 1))
 
-        logger.info(
-            f"Successfully pushed content {content.content_id} to {destination}"
-        )
 
+async def _record_new_pushes(batch: List[PushJob]) -> List[PushJob]:
+    """Store the records of newly accepted pushes and return the jobs to deliver"""
+    rows = [job.record for job in batch if job.record]
+    if not rows:
+        return batch
+
+    try:
+        stored = await _store_push_records(rows)
     except Exception as e:
-        push_record.status = "failed"
-        push_record.error_message = str(e)
-        logger.error(f"Failed to push content {content.content_id}: {e}")
+        logger.exception("Could not store %d push records", len(rows))
+        stored = {}
+        # Keep the accepted push_ids resolvable rather than losing them
+        for row in rows:
+            _remember(
+                UNRECORDED_PUSHES,
+                row["id"],
+                {
+                    "status": "failed",
+                    "created_at": row["created_at"],
+                    "error_message": f"Could not store push record: {e}",
+                },
+            )
+    finally:
+        for row in rows:
+            PENDING_PUSHES.pop(row["id"], None)
+            _PENDING_HASHES.pop(row["content_hash"], None)
 
+    for push_id, record_id in stored.items():
+        if push_id != record_id:
+            logger.info(f"Push {push_id} duplicates stored record {record_id}")
+            _remember(PUSH_ALIASES, push_id, record_id)
+
+    return [
+        job for job in batch if not job.record or stored.get(job.push_id) == job.push_id
+    ]
+
+
+async def _deliver_push(job: PushJob) -> str:
+    """Deliver one push and hand its final status to the status writer"""
+    # Wait for a connection slot here rather than inside the request timeout
+    async with PUSH_SLOTS:
+        fields = await execute_push(job.statement, job.content, job.destination)
+    PUSH_STATUS_QUEUE.put_nowait({"id": job.push_id, **fields})
+    return job.push_id
+
+
+async def _write_push_statuses(rows: List[Dict[str, Any]]):
+    """Store a batch of final statuses with one bulk UPDATE, then announce them"""
+    try:
+        async with SessionLocal() as db:
+            await db.execute(update(ContentPushRecord), rows)
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to record the status of %d pushes", len(rows))
     finally:
-        db.commit()
-        db.close()
+        for row in rows:
+            notify_push_finished(row["id"])
+            PUSH_STATUS_QUEUE.task_done()
+
+
+async def push_status_writer():
+    # Statuses from every worker share a write as soon as the window closes,
+    # so no push waits on the slowest delivery in its batch
+    while True:
+        await _write_push_statuses(await _next_batch(PUSH_STATUS_QUEUE))
+
+
+async def push_worker():
+    while True:
+        batch = await _next_batch(PUSH_QUEUE)
+        handed_off: Set[str] = set()
+        try:
+            jobs = await _record_new_pushes(batch)
+
+            # Deliver the batch concurrently; over HTTP/2 pushes to the same
+            # destination share one connection
+            results = await asyncio.gather(
+                *(_deliver_push(job) for job in jobs), return_exceptions=True
+            )
+            handed_off.update(r for r in results if isinstance(r, str))
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Push delivery failed: {result!r}")
+        except Exception:
+            logger.exception("Push worker failed to record a batch of %d", len(batch))
+        finally:
+            for job in batch:
+                QUEUED_PUSH_IDS.discard(job.push_id)
+                # The status writer announces delivered pushes once stored; wake
+                # the rest now so waiters don't block until PUSH_STATUS_TIMEOUT
+                if job.push_id not in handed_off:
+                    notify_push_finished(job.push_id)
+                PUSH_QUEUE.task_done()
+
+
+@app.on_event("startup")
+async def start_push_workers():
+    global PUSH_QUEUE, PUSH_SLOTS, PUSH_STATUS_QUEUE, _push_status_task
+    PUSH_QUEUE = asyncio.Queue(maxsize=PUSH_QUEUE_SIZE)
+    PUSH_SLOTS = asyncio.Semaphore(HTTP_MAX_CONNECTIONS)
+    PUSH_STATUS_QUEUE = asyncio.Queue()
+    _push_status_task = asyncio.create_task(push_status_writer())
+    for _ in range(PUSH_WORKERS):
+        _push_worker_tasks.append(asyncio.create_task(push_worker()))
+
+
+async def stop_push_workers():
+    global PUSH_QUEUE, PUSH_SLOTS, PUSH_STATUS_QUEUE, _push_status_task
+    if PUSH_QUEUE is None:
+        return
+
+    # Give queued and in-flight pushes a chance to finish before cancelling
+    try:
+        await asyncio.wait_for(PUSH_QUEUE.join(), PUSH_SHUTDOWN_GRACE)
+    except asyncio.TimeoutError:
+        logger.warning(f"Stopping with {PUSH_QUEUE.qsize()} pushes still queued")
+    for task in _push_worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_push_worker_tasks, return_exceptions=True)
+    _push_worker_tasks.clear()
+
+    # Write the statuses of everything delivered, then stop the writer
+    try:
+        await asyncio.wait_for(PUSH_STATUS_QUEUE.join(), PUSH_SHUTDOWN_GRACE)
+    except asyncio.TimeoutError:
+        logger.warning("Stopping before all push statuses were recorded")
+    _push_status_task.cancel()
+    await asyncio.gather(_push_status_task, return_exceptions=True)
+    _push_status_task = PUSH_STATUS_QUEUE = None
+
+    # Anything still queued is dropped with the queue; stored records left
+    # pending are retried once stale
+    PUSH_QUEUE = PUSH_SLOTS = None
+    PENDING_PUSHES.clear()
+    _PENDING_HASHES.clear()
+    QUEUED_PUSH_IDS.clear()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the workers before the adapters, HTTP client and engine they use"""
+    await stop_push_workers()
+    await close_http_client()
+    await engine.dispose()
 
 
 @app.get("/push-status/{push_id}")
 async def get_push_status(
-    push_id: str, db: Session = Depends(get_db), token: str = Depends(verify_token)
+    push_id: str, db: AsyncSession = Depends(get_db), token: str = Depends(verify_token)
 ):
     """Get status of a content push"""
-    record = db.query(ContentPushRecord).filter(ContentPushRecord.id == push_id).first()
-    if not record:
+    push = await _lookup_push(push_id, db)
+    if not push:
         raise HTTPException(status_code=404, detail="Push record not found")
+    return push
+
+
+async def _lookup_push(push_id: str, db: AsyncSession) -> Optional[Dict[str, Any]]:
+    """Status fields of a push, whether still queued, unrecorded or stored"""
+    row = PENDING_PUSHES.get(push_id) or UNRECORDED_PUSHES.get(push_id)
+    if row:
+        return {
+            "id": push_id,
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "pushed_at": None,
+            "error_message": row.get("error_message"),
+        }
+
+    record = await db.get(ContentPushRecord, PUSH_ALIASES.get(push_id, push_id))
+    if not record:
+        return None
 
     return {
         "id": record.id,
         "status": record.status,
-        "created_at": record.created_at,
-        "pushed_at": record.pushed_at,
+        "created_at": _as_utc(record.created_at),
+        "pushed_at": _as_utc(record.pushed_at),
         "error_message": record.error_message,
     }
 
 
 @app.post("/filter-rules")
 async def create_filter_rule(
-    rule_data: dict, db: Session = Depends(get_db), token: str = Depends(verify_token)
+    rule_data: dict,
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(verify_token),
 ):
     """Create a new content filter rule"""
     rule = FilterRule(
@@ -566,17 +1144,19 @@ async def create_filter_rule(
         learner_groups=rule_data.get("learner_groups"),
     )
     db.add(rule)
-    db.commit()
+    await db.commit()
+    invalidate_rules_cache()
 
     return {"message": "Filter rule created", "rule_id": rule.id}
 
 
 @app.get("/filter-rules")
 async def list_filter_rules(
-    db: Session = Depends(get_db), token: str = Depends(verify_token)
+    db: AsyncSession = Depends(get_db), token: str = Depends(verify_token)
 ):
     """List all filter rules"""
-    rules = db.query(FilterRule).all()
+    result = await db.execute(select(FilterRule))
+    rules = result.scalars().all()
     return [
         {
             "id": rule.id,
@@ -594,12 +1174,12 @@ async def list_filter_rules(
 async def test_filter(
     content: LearnerContent,
     rule_id: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     token: str = Depends(verify_token),
 ):
     """Test if content would pass filter rules"""
     content_filter = ContentFilter(db)
-    should_push, reason = content_filter.should_push(content, rule_id)
+    should_push, reason = await content_filter.should_push(content, rule_id)
 
     return {
         "should_push": should_push,
@@ -625,37 +1205,50 @@ async def list_destinations(token: str = Depends(verify_token)):
 from fastapi import WebSocket, WebSocketDisconnect
 
 
+async def _push_status_message(push_id: str) -> Optional[Dict[str, Any]]:
+    async with SessionLocal() as db:
+        push = await _lookup_push(push_id, db)
+    if not push:
+        return None
+    pushed_at = push["pushed_at"]
+    return {
+        "status": push["status"],
+        "updated_at": pushed_at.isoformat() if pushed_at else None,
+    }
+
+
 @app.websocket("/ws/push-status/{push_id}")
 async def websocket_push_status(websocket: WebSocket, push_id: str):
     await websocket.accept()
-    db = SessionLocal()
+
+    # Register before reading so a push finishing in between is not missed
+    event = asyncio.Event()
+    PUSH_EVENTS.setdefault(push_id, set()).add(event)
 
     try:
-        while True:
-            record = (
-                db.query(ContentPushRecord)
-                .filter(ContentPushRecord.id == push_id)
-                .first()
-            )
-            if record:
-                await websocket.send_json(
-                    {
-                        "status": record.status,
-                        "updated_at": (
-                            record.pushed_at.isoformat() if record.pushed_at else None
-                        ),
-                    }
-                )
+        message = await _push_status_message(push_id)
+        if message:
+            await websocket.send_json(message)
+            if message["status"] in ["success", "failed"]:
+                return
 
-                if record.status in ["success", "failed"]:
-                    break
+        try:
+            await asyncio.wait_for(event.wait(), timeout=PUSH_STATUS_TIMEOUT)
+        except asyncio.TimeoutError:
+            return
 
-            await asyncio.sleep(1)
+        message = await _push_status_message(push_id)
+        if message:
+            await websocket.send_json(message)
 
     except WebSocketDisconnect:
         pass
     finally:
-        db.close()
+        waiters = PUSH_EVENTS.get(push_id)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del PUSH_EVENTS[push_id]
 
 
 if __name__ == "__main__":
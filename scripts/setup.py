@@ -1,9 +1,10 @@
 """
 Database setup and sample data script
 """
+import atexit
 import os
 import sys
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 
 # Add parent directory to path to import main modules
@@ -11,28 +12,70 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import Base, FilterRule, ContentPushRecord
 
-def setup_database():
-    """Initialize database with sample data"""
+_engine = None
+_Session = None
+
+def get_engine():
+    """Return the script's engine, creating it on first use"""
+    global _engine
+    if _engine is not None:
+        return _engine
+    
     database_url = os.getenv("DATABASE_URL", "sqlite:///./lms_push.db")
     
     # Handle Railway PostgreSQL URL format
     if database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql://", 1)
     
-    engine = create_engine(database_url)
+    engine_kwargs = {"pool_pre_ping": True}
+    if not database_url.startswith("sqlite"):
+        engine_kwargs.update(
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_use_lifo=True,
+        )
+    
+    _engine = create_engine(database_url, **engine_kwargs)
+    return _engine
+
+def get_session():
+    """Open a session from the script's shared sessionmaker"""
+    global _Session
+    if _Session is None:
+        _Session = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False,
+            bind=get_engine()
+        )
+    return _Session()
+
+@atexit.register
+def _dispose_engine():
+    if _engine is not None:
+        _engine.dispose()
+
+def setup_database():
+    """Initialize database with sample data"""
+    engine = get_engine()
     
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+    # Create only the tables that are missing
+    insp = inspect(engine)
+    missing_tables = [
+        t for t in Base.metadata.sorted_tables if not insp.has_table(t.name)
+    ]
+    if missing_tables:
+        Base.metadata.create_all(bind=engine, tables=missing_tables)
+        print(f"✅ Created {len(missing_tables)} database tables")
+    else:
+        print("ℹ️  Database tables already exist")
     
     # Add sample filter rules
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = SessionLocal()
+    db = get_session()
     
     # Check if rules already exist
-    existing_rules = db.query(FilterRule).count()
+    has_rules = db.query(FilterRule.id).limit(1).first() is not None
     
-    if existing_rules == 0:
+    if not has_rules:
         sample_rules = [
             FilterRule(
                 name="High Quality Essays",
@@ -61,12 +104,11 @@ def setup_database():
             )
         ]
         
-        for rule in sample_rules:
-            db.add(rule)
-        
+        db.add_all(sample_rules)
         db.commit()
         print(f"✅ Added {len(sample_rules)} sample filter rules")
     else:
+        existing_rules = db.query(FilterRule).count()
         print(f"ℹ️  Database already has {existing_rules} filter rules")
     
     db.close()
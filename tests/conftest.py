@@ -0,0 +1,49 @@
+import sys
+import importlib.util
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """Load the FastAPI app from main.py once for the whole test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Always use a throwaway database and a known token, whatever the
+        # developer's shell exports; both are restored after the session
+        mp.setenv("API_TOKEN", "dev-token-123")
+        mp.setenv(
+            "DATABASE_URL", f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}"
+        )
+        spec = importlib.util.spec_from_file_location(
+            "main", Path(__file__).resolve().parents[1] / "lms-content-push" / "main.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module.app
+
+
+@pytest.fixture(scope="session")
+def service(app):
+    """The module behind the app, for its helpers and in-process push state."""
+    return sys.modules["main"]
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """A started TestClient per test module; each module restarts the app."""
+    with TestClient(app) as c:
+        yield c
+
+
+def _json(response):
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def json_body():
+    """Expose the orjson response decoder to endpoint tests."""
+    return _json
@@ -0,0 +1,54 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    "platform,url,expected",
+    [
+        (
+            "google_drive",
+            "https://drive.google.com/file/d/1a-B_c/view?usp=sharing",
+            "https://drive.google.com/uc?export=download&id=1a-B_c",
+        ),
+        (
+            "google_drive",
+            "https://drive.google.com/drive/folders",
+            "https://drive.google.com/drive/folders",
+        ),
+        (
+            "one_drive",
+            "https://onedrive.live.com/redir",
+            "https://onedrive.live.com/redir?download=1",
+        ),
+        (
+            "one_drive",
+            "https://onedrive.live.com/redir?resid=ABC",
+            "https://onedrive.live.com/redir?resid=ABC&download=1",
+        ),
+        (
+            "one_drive",
+            "https://onedrive.live.com/redir?",
+            "https://onedrive.live.com/redir?&download=1",
+        ),
+        (
+            "one_drive",
+            "https://onedrive.live.com/redir?resid=ABC&download=1",
+            "https://onedrive.live.com/redir?resid=ABC&download=1",
+        ),
+        (
+            "one_drive",
+            "https://files.example.com/download=1/report.pdf",
+            "https://files.example.com/download=1/report.pdf",
+        ),
+    ],
+    ids=[
+        "gdrive-file",
+        "gdrive-no-id",
+        "onedrive-no-query",
+        "onedrive-query",
+        "onedrive-empty-query",
+        "onedrive-already-download",
+        "onedrive-download-in-path",
+    ],
+)
+def test_convert_drive_link(service, platform, url, expected):
+    assert service.convert_drive_link(url, service.DrivePlatform(platform)) == expected
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import delete
+
+AUTH_HEADERS = {"Authorization": "Bearer dev-token-123"}
+
+
+@pytest.fixture(autouse=True)
+def no_rules(client, service):
+    """Start and finish each test with no filter rules stored or cached."""
+
+    async def clear_rules():
+        async with service.SessionLocal() as db:
+            await db.execute(delete(service.FilterRule))
+            await db.commit()
+        service.invalidate_rules_cache()
+
+    client.portal.call(clear_rules)
+    yield
+    client.portal.call(clear_rules)
+
+
+@pytest.fixture
+def create_rule(client):
+    def create_rule(name, content_types, **fields):
+        response = client.post(
+            "/filter-rules",
+            json={"name": name, "content_types": content_types, **fields},
+            headers=AUTH_HEADERS,
+        )
+        assert response.status_code == 200
+
+    return create_rule
+
+
+@pytest.fixture
+def check(client, json_body):
+    """Run /test-filter on a piece of content and return (should_push, reason)."""
+
+    def check(content_type, tags=()):
+        response = client.post(
+            "/test-filter",
+            json={
+                "learner_id": "learner-1",
+                "learner_name": "Ada Learner",
+                "learner_email": "ada@example.com",
+                "content_id": "content-1",
+                "content_type": content_type,
+                "title": "Work",
+                "content_url": "https://example.com/work",
+                "submission_date": "2024-01-01T00:00:00Z",
+                "tags": list(tags),
+            },
+            headers=AUTH_HEADERS,
+        )
+        assert response.status_code == 200
+        payload = json_body(response)
+        return payload["should_push"], payload["reason"]
+
+    return check
+
+
+def test_new_rule_invalidates_cached_rules(create_rule, check):
+    assert check("essay") == (True, "No active filter rules - allowing all content")
+
+    # Within the cache TTL, the new rule is still seen straight away
+    create_rule("Videos", ["video"])
+    assert check("essay") == (False, "Content does not match any filter rules")
+    assert check("video") == (True, "Matches rule: Videos")
+
+
+def test_rule_without_content_types_matches_every_type(create_rule, check):
+    create_rule("Videos", ["video"])
+    create_rule("Anything reviewed", [], tags_required=["reviewed"])
+
+    for content_type in ("essay", "code", "quiz"):
+        assert check(content_type, ["reviewed"]) == (
+            True,
+            "Matches rule: Anything reviewed",
+        )
+    assert check("code")[0] is False
+
+
+def test_first_matching_rule_wins_across_type_buckets(create_rule, check):
+    create_rule("Videos", ["video"])
+    create_rule("Anything reviewed", [], tags_required=["reviewed"])
+    create_rule("Essays", ["essay"])
+
+    assert check("essay", ["reviewed"]) == (True, "Matches rule: Anything reviewed")
+    assert check("essay") == (True, "Matches rule: Essays")
+    assert check("video", ["reviewed"]) == (True, "Matches rule: Videos")
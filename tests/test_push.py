@@ -0,0 +1,254 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import update
+
+AUTH_HEADERS = {"Authorization": "Bearer dev-token-123"}
+DESTINATION = "analytics_webhook"
+
+
+class FakeDestination:
+    """Webhook stand-in that answers with `status_code`, optionally held on `gate`"""
+
+    def __init__(self):
+        self.status_code = 200
+        self.gate = None
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append(request)
+        if self.gate is not None:
+            await self.gate.wait()
+        return httpx.Response(self.status_code)
+
+
+@pytest.fixture
+def destination(client, service, monkeypatch):
+    """Route pushes to DESTINATION through a MockTransport client."""
+    fake = FakeDestination()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+    adapter = service.DestinationFactory.create_adapter(
+        service.DESTINATIONS[DESTINATION], http
+    )
+    monkeypatch.setitem(service.ADAPTERS, DESTINATION, adapter)
+    yield fake
+    client.portal.call(http.aclose)
+
+
+@pytest.fixture
+def push(client, json_body):
+    def push(content_id):
+        response = client.post(
+            "/push-content", json=push_body(content_id), headers=AUTH_HEADERS
+        )
+        assert response.status_code == 200
+        return json_body(response)
+
+    return push
+
+
+@pytest.fixture
+def push_status(client, json_body):
+    def push_status(push_id):
+        response = client.get(f"/push-status/{push_id}", headers=AUTH_HEADERS)
+        assert response.status_code == 200
+        return json_body(response)
+
+    return push_status
+
+
+@pytest.fixture
+def drain(client, service):
+    """Wait until every queued push is delivered and its status stored."""
+
+    async def drain():
+        await service.PUSH_QUEUE.join()
+        await service.PUSH_STATUS_QUEUE.join()
+
+    return lambda: client.portal.call(drain)
+
+
+def push_body(content_id):
+    return {
+        "destination": DESTINATION,
+        "content": {
+            "learner_id": "learner-1",
+            "learner_name": "Ada Learner",
+            "learner_email": "ada@example.com",
+            "content_id": content_id,
+            "content_type": "essay",
+            "title": "Essay",
+            "content_url": "https://example.com/essay.pdf",
+            "submission_date": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+def new_content_id():
+    return f"content-{uuid.uuid4()}"
+
+
+def test_duplicate_push_returns_original_push_id(client, push, drain, destination):
+    content_id = new_content_id()
+    destination.gate = asyncio.Event()
+
+    first = push(content_id)
+    assert first["message"] == "Content push initiated"
+
+    pending = push(content_id)
+    assert pending["message"] == "Duplicate content push"
+    assert pending["push_id"] == first["push_id"]
+    assert pending["statement_id"] == first["statement_id"]
+    assert pending["status"] == "pending"
+
+    client.portal.call(destination.gate.set)
+    drain()
+
+    stored = push(content_id)
+    assert stored["message"] == "Duplicate content push"
+    assert stored["push_id"] == first["push_id"]
+    assert stored["statement_id"] == first["statement_id"]
+    assert stored["status"] == "success"
+    assert len(destination.requests) == 1
+
+
+def test_failed_push_is_retried(push, push_status, drain, destination):
+    content_id = new_content_id()
+    destination.status_code = 500
+
+    first = push(content_id)
+    drain()
+    assert push_status(first["push_id"])["status"] == "failed"
+
+    destination.status_code = 200
+    retry = push(content_id)
+    assert retry["message"] == "Content push initiated"
+    assert retry["push_id"] == first["push_id"]
+    drain()
+
+    status = push_status(first["push_id"])
+    assert status["status"] == "success"
+    assert status["error_message"] is None
+    assert len(destination.requests) == 2
+
+
+def test_abandoned_pending_push_is_retried(
+    client, service, push, push_status, drain, destination
+):
+    content_id = new_content_id()
+    first = push(content_id)
+    drain()
+
+    async def mark_pending(created_at):
+        async with service.SessionLocal() as db:
+            await db.execute(
+                update(service.ContentPushRecord)
+                .where(service.ContentPushRecord.id == first["push_id"])
+                .values(status="pending", created_at=created_at)
+            )
+            await db.commit()
+
+    # Recently pending: still in someone's hands
+    client.portal.call(mark_pending, service._utcnow())
+    assert push(content_id)["message"] == "Duplicate content push"
+
+    # Pending for longer than any delivery can take: abandoned
+    client.portal.call(mark_pending, service._utcnow() - 2 * service.PUSH_STALE_AFTER)
+    retry = push(content_id)
+    assert retry["message"] == "Content push initiated"
+    assert retry["push_id"] == first["push_id"]
+    drain()
+
+    assert push_status(first["push_id"])["status"] == "success"
+    assert len(destination.requests) == 2
+
+
+def test_push_status_while_pending_and_after(
+    client, push, push_status, drain, destination
+):
+    destination.gate = asyncio.Event()
+    first = push(new_content_id())
+
+    status = push_status(first["push_id"])
+    assert status["status"] == "pending"
+    assert status["pushed_at"] is None
+    assert status["created_at"].endswith("+00:00")
+
+    client.portal.call(destination.gate.set)
+    drain()
+
+    status = push_status(first["push_id"])
+    assert status["status"] == "success"
+    assert status["created_at"].endswith("+00:00")
+    assert status["pushed_at"].endswith("+00:00")
+
+
+def test_unstored_push_reports_failed(service, push, push_status, drain, destination):
+    async def failing_insert(rows):
+        raise RuntimeError("database unavailable")
+
+    content_id = new_content_id()
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(service, "_insert_push_records", failing_insert)
+        m.setattr(service, "PUSH_INSERT_BACKOFF", 0)
+        first = push(content_id)
+        drain()
+
+    status = push_status(first["push_id"])
+    assert status["status"] == "failed"
+    assert "database unavailable" in status["error_message"]
+    assert destination.requests == []
+    # Only the status fields are kept in memory, not the statement
+    assert set(service.UNRECORDED_PUSHES[first["push_id"]]) == {
+        "status",
+        "created_at",
+        "error_message",
+    }
+
+    # The content is not left marked as pending
+    assert push(content_id)["message"] == "Content push initiated"
+    drain()
+    assert len(destination.requests) == 1
+
+
+def test_full_queue_rejects_push(client, service, push, drain, destination):
+    content_id = new_content_id()
+    full_queue = asyncio.Queue(maxsize=1)
+    full_queue.put_nowait(None)
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(service, "PUSH_QUEUE", full_queue)
+        response = client.post(
+            "/push-content", json=push_body(content_id), headers=AUTH_HEADERS
+        )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    # Nothing was registered, so the same content can be pushed once there is room
+    assert push(content_id)["message"] == "Content push initiated"
+    drain()
+    assert len(destination.requests) == 1
+
+
+def test_status_websocket_reports_stored_result(client, push, drain, destination):
+    destination.gate = asyncio.Event()
+    first = push(new_content_id())
+
+    with client.websocket_connect(f"/ws/push-status/{first['push_id']}") as ws:
+        assert ws.receive_json()["status"] == "pending"
+        client.portal.call(destination.gate.set)
+        final = ws.receive_json()
+
+    assert final["status"] == "success"
+    assert final["updated_at"].endswith("+00:00")
+    drain()
+
+
+def test_in_memory_push_maps_are_bounded(service, monkeypatch):
+    monkeypatch.setattr(service, "PUSH_MEMORY_LIMIT", 2)
+    aliases = {}
+    for push_id in ("a", "b", "c"):
+        service._remember(aliases, push_id, f"record-{push_id}")
+    assert aliases == {"b": "record-b", "c": "record-c"}